@@ -20,6 +20,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import re
+import sys
 
 # Optional import - CrewAI only needed for validate_all() method
 try:
@@ -30,6 +31,62 @@ except ImportError:
     CrewOutput = None  # Type hint placeholder
 
 
+# Patterns that indicate low quality or hallucinations
+RED_FLAG_PATTERNS = (
+    r"I don't have enough information",
+    r"As an AI",
+    r"I cannot",
+    r"I apologize.*cannot",
+    r"\[YOUR_.*?\]",  # e.g., [YOUR_API_KEY]
+    r"\{.*?PLACEHOLDER.*?\}",
+    r"<INSERT.*?>",
+    r"TODO: implement",
+    r"FIXME",
+    r"XXX",
+)
+
+# Credential names that must never appear with a hardcoded value
+SECURITY_PATTERNS = (
+    r'api[_-]?key',
+    r'password',
+    r'secret',
+    r'token',
+    r'private[_-]?key',
+)
+
+# Keywords that indicate actionable, specific guidance
+QUALITY_INDICATORS = (
+    "specifically",
+    "for example",
+    "here's how",
+    "step 1",
+    "recommendation",
+    "implementation",
+    "```",  # Code blocks
+)
+
+# Wording that shows the output gives concrete recommendations
+_RECOMMENDATION_INDICATORS = ('recommendation', 'suggest', 'should', 'consider', 'step 1', 'step 2')
+
+# Hedging language that signals a lack of decisiveness
+VAGUE_PHRASES = (
+    'may want to', 'could consider', 'might be good',
+    'perhaps', 'possibly', 'maybe', 'sort of', 'kind of'
+)
+
+# Keywords that show cost considerations were addressed
+COST_KEYWORDS = ('cost', 'pricing', 'budget', 'expense', 'rate limit')
+
+# Compiled once at import - these run on every validated output
+_HEADER_RE = re.compile(r'^#{1,3}\s', re.MULTILINE)
+_CODEBLOCK_RE = re.compile(r'```[\s\S]*?```')
+_TECHNICAL_ROLE_RE = re.compile('engineer|developer|architect', re.IGNORECASE)
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to a regular __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class ValidationSeverity(Enum):
     """Severity levels for validation issues"""
     CRITICAL = "critical"  # Must fix - blocks production use
@@ -37,7 +94,7 @@ class ValidationSeverity(Enum):
     INFO = "info"          # Nice to have - improvement suggestion
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationIssue:
     """Represents a single validation issue"""
     check_name: str
@@ -47,7 +104,7 @@ class ValidationIssue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of validation checks"""
     is_valid: bool
@@ -58,12 +115,12 @@ class ValidationResult:
     
     def get_summary(self) -> str:
         """Get human-readable summary"""
-        critical_count = sum(1 for issue in self.failed_checks if issue.severity == ValidationSeverity.CRITICAL)
+        critical_count = sum(1 for issue in self.failed_checks if issue.severity is ValidationSeverity.CRITICAL)
         warning_count = len(self.warnings)
         
         status = "✅ PASSED" if self.is_valid else "❌ FAILED"
         
-        summary = f"""
+        parts = [f"""
 {'='*60}
 QUALITY VALIDATION RESULTS
 {'='*60}
@@ -75,24 +132,47 @@ Checks Passed: {len(self.passed_checks)}
 Critical Issues: {critical_count}
 Warnings: {warning_count}
 
-"""
+"""]
         if self.failed_checks:
-            summary += "\n🚨 CRITICAL ISSUES:\n"
+            parts.append("\n🚨 CRITICAL ISSUES:\n")
             for issue in self.failed_checks:
-                if issue.severity == ValidationSeverity.CRITICAL:
-                    summary += f"  • {issue.check_name}: {issue.message}\n"
+                if issue.severity is ValidationSeverity.CRITICAL:
+                    parts.append(f"  • {issue.check_name}: {issue.message}\n")
                     if issue.suggestion:
-                        summary += f"    💡 {issue.suggestion}\n"
+                        parts.append(f"    💡 {issue.suggestion}\n")
         
         if self.warnings:
-            summary += "\n⚠️  WARNINGS:\n"
+            parts.append("\n⚠️  WARNINGS:\n")
             for warning in self.warnings:
-                summary += f"  • {warning.check_name}: {warning.message}\n"
+                parts.append(f"  • {warning.check_name}: {warning.message}\n")
                 if warning.suggestion:
-                    summary += f"    💡 {warning.suggestion}\n"
+                    parts.append(f"    💡 {warning.suggestion}\n")
         
-        summary += f"\n{'='*60}\n"
-        return summary
+        parts.append(f"\n{'='*60}\n")
+        return ''.join(parts)
+
+
+def _finalize_result(passed: List[str],
+                     issues: List[ValidationIssue],
+                     warnings: List[ValidationIssue]) -> ValidationResult:
+    """Score collected checks and build the ValidationResult"""
+    total_checks = len(passed) + len(issues) + len(warnings)
+    if total_checks == 0:
+        score = 0.0
+    else:
+        # Passed checks = 100%, Warnings = 50%, Failed = 0%
+        score = ((len(passed) * 100) + (len(warnings) * 50)) / total_checks
+    
+    # Valid means no critical issues
+    is_valid = not any(i.severity is ValidationSeverity.CRITICAL for i in issues)
+    
+    return ValidationResult(
+        is_valid=is_valid,
+        passed_checks=passed,
+        failed_checks=issues,
+        warnings=warnings,
+        score=score
+    )
 
 
 class AgentOutputValidator:
@@ -113,7 +193,8 @@ class AgentOutputValidator:
                  min_output_length: int = 500,
                  require_code_examples: bool = True,
                  require_specific_recommendations: bool = True,
-                 check_for_placeholders: bool = True):
+                 check_for_placeholders: bool = True,
+                 short_circuit_on_min_length: bool = False):
         """
         Initialize validator with quality criteria
         
@@ -122,36 +203,22 @@ class AgentOutputValidator:
             require_code_examples: Require code examples in technical outputs
             require_specific_recommendations: Require specific, actionable items
             check_for_placeholders: Flag generic placeholders like "TODO", "FIXME"
+            short_circuit_on_min_length: Skip the remaining checks when an output
+                fails the minimum length check
         """
         self.min_output_length = min_output_length
         self.require_code_examples = require_code_examples
         self.require_specific_recommendations = require_specific_recommendations
         self.check_for_placeholders = check_for_placeholders
+        self.short_circuit_on_min_length = short_circuit_on_min_length
         
         # Patterns that indicate low quality or hallucinations
-        self.red_flag_patterns = [
-            r"I don't have enough information",
-            r"As an AI",
-            r"I cannot",
-            r"I apologize.*cannot",
-            r"\[YOUR_.*?\]",  # e.g., [YOUR_API_KEY]
-            r"\{.*?PLACEHOLDER.*?\}",
-            r"<INSERT.*?>",
-            r"TODO: implement",
-            r"FIXME",
-            r"XXX",
-        ]
+        self.red_flag_patterns = list(RED_FLAG_PATTERNS)
+        self._red_flag_regexes = [re.compile(p, re.IGNORECASE) for p in self.red_flag_patterns]
         
         # Keywords that indicate actionable, specific guidance
-        self.quality_indicators = [
-            "specifically",
-            "for example",
-            "here's how",
-            "step 1",
-            "recommendation",
-            "implementation",
-            "```",  # Code blocks
-        ]
+        self.quality_indicators = list(QUALITY_INDICATORS)
+        self._quality_indicators_lower = tuple(indicator.lower() for indicator in self.quality_indicators)
     
     def validate_all(self, crew_output: Any) -> ValidationResult:
         """
@@ -178,34 +245,15 @@ class AgentOutputValidator:
         
         # Validate each task output
         for i, task_output in enumerate(crew_output.tasks_output, 1):
-            agent_role = task_output.agent if hasattr(task_output, 'agent') else f"Agent {i}"
-            output_text = task_output.raw if hasattr(task_output, 'raw') else str(task_output)
+            agent_role = getattr(task_output, 'agent', None) or f"Agent {i}"
+            output_text = getattr(task_output, 'raw', None)
+            if output_text is None:
+                output_text = str(task_output)
             
             # Run all validation checks
-            issues, warnings, checks_passed = self._validate_output(output_text, agent_role)
-            all_issues.extend(issues)
-            all_warnings.extend(warnings)
-            passed.extend(checks_passed)
+            self._validate_output_into(output_text, agent_role, all_issues, all_warnings, passed)
         
-        # Calculate quality score
-        total_checks = len(passed) + len(all_issues) + len(all_warnings)
-        if total_checks == 0:
-            score = 0.0
-        else:
-            # Passed checks = 100%, Warnings = 50%, Failed = 0%
-            score = ((len(passed) * 100) + (len(all_warnings) * 50)) / total_checks
-        
-        # Determine if valid (no critical issues)
-        critical_issues = [i for i in all_issues if i.severity == ValidationSeverity.CRITICAL]
-        is_valid = len(critical_issues) == 0
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            passed_checks=passed,
-            failed_checks=all_issues,
-            warnings=all_warnings,
-            score=score
-        )
+        return _finalize_result(passed, all_issues, all_warnings)
     
     def _validate_output(self, output: str, agent_role: str) -> tuple:
         """
@@ -217,7 +265,25 @@ class AgentOutputValidator:
         issues = []
         warnings = []
         passed = []
+        self._validate_output_into(output, agent_role, issues, warnings, passed)
+        return issues, warnings, passed
+    
+    def _validate_output_into(self,
+                              output: str,
+                              agent_role: str,
+                              issues: List[ValidationIssue],
+                              warnings: List[ValidationIssue],
+                              passed: List[str]) -> None:
+        """
+        Validate a single agent output, appending results to the given lists
         
+        Args:
+            output: The output text to validate
+            agent_role: Name/role of the agent for context
+            issues: Receives critical issues
+            warnings: Receives warnings
+            passed: Receives names of passed checks
+        """
         # Check 1: Minimum length
         if len(output) < self.min_output_length:
             issues.append(ValidationIssue(
@@ -227,18 +293,23 @@ class AgentOutputValidator:
                 agent_role=agent_role,
                 suggestion="Agent should provide more detailed analysis and recommendations"
             ))
+            if self.short_circuit_on_min_length:
+                return
         else:
             passed.append(f"{agent_role}: Minimum length")
         
+        # Lowercase once - reused by every keyword check below
+        lower = output.lower()
+        
         # Check 2: Red flag patterns (hallucinations, placeholders)
         if self.check_for_placeholders:
-            for pattern in self.red_flag_patterns:
-                matches = re.findall(pattern, output, re.IGNORECASE)
-                if matches:
+            for rx in self._red_flag_regexes:
+                match = rx.search(output)
+                if match:
                     issues.append(ValidationIssue(
                         check_name="Placeholder Detection",
                         severity=ValidationSeverity.CRITICAL,
-                        message=f"Found placeholder or low-quality content: {matches[0][:50]}",
+                        message=f"Found placeholder or low-quality content: {match.group(0)[:50]}",
                         agent_role=agent_role,
                         suggestion="Remove placeholders and provide specific, concrete recommendations"
                     ))
@@ -248,8 +319,8 @@ class AgentOutputValidator:
         
         # Check 3: Contains code examples (for technical roles)
         if self.require_code_examples:
-            code_blocks = re.findall(r'```[\s\S]*?```', output)
-            if not code_blocks and any(role in agent_role.lower() for role in ['engineer', 'developer', 'architect']):
+            has_code = _CODEBLOCK_RE.search(output) is not None
+            if not has_code and _TECHNICAL_ROLE_RE.search(agent_role):
                 warnings.append(ValidationIssue(
                     check_name="Code Examples",
                     severity=ValidationSeverity.WARNING,
@@ -257,15 +328,12 @@ class AgentOutputValidator:
                     agent_role=agent_role,
                     suggestion="Include code snippets to demonstrate recommended approaches"
                 ))
-            elif code_blocks:
+            elif has_code:
                 passed.append(f"{agent_role}: Code examples present")
         
         # Check 4: Specific recommendations
         if self.require_specific_recommendations:
-            has_recommendations = any(
-                indicator in output.lower() 
-                for indicator in ['recommendation', 'suggest', 'should', 'consider', 'step 1', 'step 2']
-            )
+            has_recommendations = any(indicator in lower for indicator in _RECOMMENDATION_INDICATORS)
             
             if not has_recommendations:
                 issues.append(ValidationIssue(
@@ -278,8 +346,13 @@ class AgentOutputValidator:
             else:
                 passed.append(f"{agent_role}: Has recommendations")
         
-        # Check 5: Quality indicators
-        quality_score = sum(1 for indicator in self.quality_indicators if indicator.lower() in output.lower())
+        # Check 5: Quality indicators (two are enough, so stop counting there)
+        quality_score = 0
+        for indicator in self._quality_indicators_lower:
+            if indicator in lower:
+                quality_score += 1
+                if quality_score >= 2:
+                    break
         
         if quality_score < 2:
             warnings.append(ValidationIssue(
@@ -293,7 +366,7 @@ class AgentOutputValidator:
             passed.append(f"{agent_role}: Sufficient technical depth")
         
         # Check 6: Structure (sections, headers)
-        has_structure = bool(re.search(r'^#{1,3}\s', output, re.MULTILINE))
+        has_structure = _HEADER_RE.search(output) is not None
         
         if not has_structure:
             warnings.append(ValidationIssue(
@@ -307,12 +380,7 @@ class AgentOutputValidator:
             passed.append(f"{agent_role}: Well-structured output")
         
         # Check 7: Vagueness detection
-        vague_phrases = [
-            'may want to', 'could consider', 'might be good',
-            'perhaps', 'possibly', 'maybe', 'sort of', 'kind of'
-        ]
-        
-        vague_count = sum(output.lower().count(phrase) for phrase in vague_phrases)
+        vague_count = sum(lower.count(phrase) for phrase in VAGUE_PHRASES)
         
         if vague_count > 5:
             warnings.append(ValidationIssue(
@@ -324,8 +392,6 @@ class AgentOutputValidator:
             ))
         else:
             passed.append(f"{agent_role}: Specific language")
-        
-        return issues, warnings, passed
     
     def validate_output_text(self, output: str, agent_role: str = "Agent") -> ValidationResult:
         """
@@ -340,19 +406,7 @@ class AgentOutputValidator:
         """
         issues, warnings, passed = self._validate_output(output, agent_role)
         
-        total_checks = len(passed) + len(issues) + len(warnings)
-        score = ((len(passed) * 100) + (len(warnings) * 50)) / total_checks if total_checks > 0 else 0.0
-        
-        critical_issues = [i for i in issues if i.severity == ValidationSeverity.CRITICAL]
-        is_valid = len(critical_issues) == 0
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            passed_checks=passed,
-            failed_checks=issues,
-            warnings=warnings,
-            score=score
-        )
+        return _finalize_result(passed, issues, warnings)
 
 
 class ProductionReadinessChecker:
@@ -362,21 +416,18 @@ class ProductionReadinessChecker:
     """
     
     def __init__(self):
-        self.security_patterns = [
-            r'api[_-]?key',
-            r'password',
-            r'secret',
-            r'token',
-            r'private[_-]?key',
+        self.security_patterns = list(SECURITY_PATTERNS)
+        self._security_regexes = [
+            (pattern, re.compile(f'{pattern}\\s*[=:]\\s*["\']?([^"\'\\s]+)', re.IGNORECASE))
+            for pattern in self.security_patterns
         ]
     
     def check_security(self, output: str) -> List[ValidationIssue]:
         """Check for potential security issues in output"""
         issues = []
         
-        for pattern in self.security_patterns:
-            matches = re.findall(f'{pattern}\\s*[=:]\\s*["\']?([^"\'\\s]+)', output, re.IGNORECASE)
-            if matches:
+        for pattern, rx in self._security_regexes:
+            if rx.search(output):
                 issues.append(ValidationIssue(
                     check_name="Security - Exposed Credentials",
                     severity=ValidationSeverity.CRITICAL,
@@ -390,8 +441,9 @@ class ProductionReadinessChecker:
         """Verify cost considerations are mentioned"""
         warnings = []
         
-        cost_keywords = ['cost', 'pricing', 'budget', 'expense', 'rate limit']
-        has_cost_mention = any(keyword in output.lower() for keyword in cost_keywords)
+        # Lowercase once rather than once per keyword
+        lower = output.lower()
+        has_cost_mention = any(keyword in lower for keyword in COST_KEYWORDS)
         
         if not has_cost_mention and len(output) > 1000:
             warnings.append(ValidationIssue(
@@ -403,6 +455,27 @@ class ProductionReadinessChecker:
         
         return warnings
     
+    def _check_output(self, output: str) -> tuple:
+        """
+        Run production checks on a single task output
+        
+        Returns:
+            Tuple of (issues, warnings, passed_checks)
+        """
+        passed = []
+        
+        # Security check
+        issues = self.check_security(output)
+        if not issues:
+            passed.append("Security: No exposed credentials")
+        
+        # Cost check
+        warnings = self.check_cost_estimates(output)
+        if not warnings:
+            passed.append("Cost awareness: Present")
+        
+        return issues, warnings, passed
+    
     def validate_for_production(self, crew_output: Any) -> ValidationResult:
         """
         Comprehensive production readiness check
@@ -427,34 +500,22 @@ class ProductionReadinessChecker:
         passed = []
         
         for task_output in crew_output.tasks_output:
-            output_text = task_output.raw if hasattr(task_output, 'raw') else str(task_output)
-            
-            # Security check
-            security_issues = self.check_security(output_text)
-            all_issues.extend(security_issues)
+            output_text = getattr(task_output, 'raw', None)
+            if output_text is None:
+                output_text = str(task_output)
             
-            if not security_issues:
-                passed.append("Security: No exposed credentials")
-            
-            # Cost check
-            cost_warnings = self.check_cost_estimates(output_text)
-            all_warnings.extend(cost_warnings)
-            
-            if not cost_warnings:
-                passed.append("Cost awareness: Present")
-        
-        total_checks = len(passed) + len(all_issues) + len(all_warnings)
-        score = ((len(passed) * 100) + (len(all_warnings) * 50)) / total_checks if total_checks > 0 else 0.0
-        
-        is_valid = len([i for i in all_issues if i.severity == ValidationSeverity.CRITICAL]) == 0
+            issues, warnings, checks_passed = self._check_output(output_text)
+            all_issues.extend(issues)
+            all_warnings.extend(warnings)
+            passed.extend(checks_passed)
         
-        return ValidationResult(
-            is_valid=is_valid,
-            passed_checks=passed,
-            failed_checks=all_issues,
-            warnings=all_warnings,
-            score=score
-        )
+        return _finalize_result(passed, all_issues, all_warnings)
+
+
+# Shared default instances for quick_validate() - validators keep no per-call
+# state, so building (and compiling patterns) once is enough
+_DEFAULT_VALIDATOR = None
+_DEFAULT_PROD_CHECKER = None
 
 
 # Convenience function for quick validation
@@ -478,11 +539,17 @@ def quick_validate(crew_output: Any, production_mode: bool = False) -> Validatio
             "Or install CrewAI: pip install crewai"
         )
     
-    validator = AgentOutputValidator()
+    global _DEFAULT_VALIDATOR, _DEFAULT_PROD_CHECKER
+    
+    if _DEFAULT_VALIDATOR is None:
+        _DEFAULT_VALIDATOR = AgentOutputValidator()
+    validator = _DEFAULT_VALIDATOR
     result = validator.validate_all(crew_output)
     
     if production_mode:
-        prod_checker = ProductionReadinessChecker()
+        if _DEFAULT_PROD_CHECKER is None:
+            _DEFAULT_PROD_CHECKER = ProductionReadinessChecker()
+        prod_checker = _DEFAULT_PROD_CHECKER
         prod_result = prod_checker.validate_for_production(crew_output)
         
         # Merge results
@@ -491,9 +558,7 @@ def quick_validate(crew_output: Any, production_mode: bool = False) -> Validatio
         result.passed_checks.extend(prod_result.passed_checks)
         
         # Recalculate score
-        total = len(result.passed_checks) + len(result.failed_checks) + len(result.warnings)
-        result.score = ((len(result.passed_checks) * 100) + (len(result.warnings) * 50)) / total if total > 0 else 0.0
-        result.is_valid = len([i for i in result.failed_checks if i.severity == ValidationSeverity.CRITICAL]) == 0
+        result = _finalize_result(result.passed_checks, result.failed_checks, result.warnings)
     
     return result
 